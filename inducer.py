@@ -1,312 +1,357 @@
 import getopt
+import locale
+import os
+import sys
+from collections import deque
+from multiprocessing import Pool
 
 class Grammar:
 	"""
 	A class for LCFRS-grammars.
 	
 	Attributes:
-	 self.rules: a list of Rule objects
+	 self.forms: a set of the forms of the rules of the grammar
+	 self._formCache: a dictionary from the structural keys (see Node.structuralKey) of the nodes that rules have been induced from to the forms of those rules
+	 self._interned: a dictionary holding the one copy of each label and word seen so far, see Node.__init__
 	
 	Functions:
-	 self.__init__(f): from an inputfile "f" in NeGra-format collect a list of trees, then for each tree call the function self.induce
-	 self.induce(tree): induce LCFRS rules from a tree "tree" and add them to self.rules if they are not a duplicate of a rule already in there
-	 self.pprint(): print the form of each rule in self.rules in alphabetical order
-	 self.pwrite(output): write the form of each rule in self.rules on outputfile "output" in alphabetical order
+	 self.__init__(f,processes,verbose): read the trees from an inputfile "f" in NeGra-format one by one, and induce the rules of each tree, using "processes" worker processes and reporting the progress if "verbose" is True
+	 self.induce(tree): induce LCFRS rules from a tree "tree" and add their forms to self.forms
+	 self.pprint(): print the form of each rule in self.forms in alphabetical order
+	 self.pwrite(output): write the form of each rule in self.forms on outputfile "output" in alphabetical order
 	"""
-	def __init__(self,f):
+	def __init__(self,f,processes=1,verbose=False):
 		"""
-		Collects a list of trees from a treebank file, then calls the function self.induce for each tree.
+		Reads the trees from a treebank file one by one, and induces the rules of each tree.
+		The trees don't depend on eachother, so if more than one process is asked for, they are divided over a pool of worker processes, each returning the forms of its rules to be collected in self.forms
 		
-		Input: a treebank file "f" in NeGra-format
+		Input:
+		 f: a treebank file in NeGra-format
+		 processes: the number of processes to use, at least 1. If 1, induce all trees in this process without starting any workers
+		 verbose: if True, report the progress on stderr every 1000 trees
+		"""
+		self.forms = set()
+		self._formCache = {} #for every structural key seen so far in this process, the form of the rule induced from it
+		self._interned = {} #the one copy of each label and word seen so far in this process
+		if processes == 1:
+			self._collect((induceTree(tree,self._formCache,self._interned) for tree in iterTrees(f)),verbose) #the trees are read one at a time, so we never need to keep the whole treebank in memory
+		else:
+			with Pool(processes,initializer=initWorker) as pool:
+				self._collect(pool.imap_unordered(induceInWorker,iterTrees(f),chunksize=64),verbose) #the order in which the trees come back doesn't matter, since the forms end up in a set anyway
+		print("induction complete")
+
+	def _collect(self,results,verbose):
+		"""
+		Adds the forms induced from each tree to self.forms
+		
+		Input:
+		 results: an iterable of sets of forms, one for every tree
+		 verbose: if True, report the progress on stderr every 1000 trees
 		"""
-		self.rules = []
-		with open(f, 'r') as fileObject:
-			lines = fileObject.read().splitlines()
-		trees = []
-		for line in lines:
-			if line[:4] == "#BOS":
-				tree = [] #Initializing a new treelist at beginning of sequence (#BOS)
-			elif line[:4] == "#EOS":
-				index = line[5:] 
-				trees.append(tree) #Appending the tree to the list of trees at end of sequence (#EOS)
-			else:
-				tree.append(line) #Putting nodes (lines) in the treelist
 		count = 0
-		for tree in trees:
-			self.induce(tree)
+		for newforms in results:
+			self.forms |= newforms
 			count +=1
-			if count%100==0: #counter to check the progress
-				print(str(count)+" trees complete")
-		print("induction complete")
+			if verbose and count%1000==0: #counter to check the progress. It goes to stderr so that it doesn't get mixed up with the grammar when that is printed
+				sys.stderr.write(f"{count} trees complete\n")
 
 	def induce(self,tree):
 		"""
-		Induces LCFRS rules from a tree "tree" and add them to self.rules if they are not a duplicate of a rule already in there.
+		Induces LCFRS rules from a tree "tree" and adds their forms to self.forms
 		
-		Input: a list of lines representing nodes from a tree in NeGra-format
+		Input: a list of lines representing nodes from a tree in NeGra-format, either as bytes or as strings, which are encoded with ENCODING
 		"""
-		nodes = {} #we put the nodes in a dictionary so it becomes easy to look them up by their id
-		leaves = []
-		for line in tree:
-			node = Node(line.split("\t"))
-			if node.id[0] == "#":
-				nodes[node.id[1:]]=node #the "#" is sliced off since it also doesn't appear in node.mother
-			else: #if the nodeID doesn't start with "#", the nodeID is instead the word on the input string, and therefore this node is a leaf node
-				leaves.append(node)
-		for s in range(len(leaves)):
-			leaves[s].strID=[s] 
-			"""Since we're looping over the leaves anyway, we're setting the string ID right here.
-			Since the words are in order of their appearance the string ID matches the position in the list of leaves"""
-			mother = nodes[leaves[s].mother]
-			mother.daughters.append(leaves[s]) #As should be obvious, a node is one of its mother's daughter nodes
-		for node in nodes.values():
-			if node.mother != "0": #O is the ID of a root node's mother. Since a root node is not the daugther of any node, the following lines do not apply to them
-				mother = nodes[node.mother]
-				mother.daughters.append(node)
-		nodes2 = [] #now that we have found the mother nodes, we don't need a dictionary anymore, so we are going to collect our nodes in a list
-		nodesval = list(nodes.values()) #We go from a dict to a list because we want to edit the data structure while looping
-		while nodesval != []: #only stop this loop if we are sure that all nodes have their string ID
-			for node in nodesval:
-				if node.allDaughtersHaveStrID(): #Do not get the string ID until all daughter nodes have their string ID's
-					node.getStrID()
-					nodes2.append(node)
-					#When the string ID is obtained, move the node from nodesval to nodes2
-					nodesval.remove(node)
-		for leaf in leaves:
-			newrule = Rule(leaf)
-			if self.rules ==[]: #if this is the first rule, we don't need to check if it's a duplicate
-				self.rules.append(newrule)
-			else:
-				isDupl = False
-				for rule in self.rules:
-					if newrule.form == rule.form: #if two rules have the same form, they are duplicates of eachother, so the new one should not be added to the grammar
-						isDupl = True
-						break
-				if not isDupl:
-					self.rules.append(newrule)
-		for node in nodes2:
-			newrule = Rule(node)
-			if self.rules ==[]:
-				self.rules.append(newrule)
-			else:
-				isDupl = False
-				for rule in self.rules:
-					if newrule.form == rule.form:
-						isDupl = True
-						break
-				if not isDupl:
-					self.rules.append(newrule)
+		tree = [line.encode(ENCODING) if isinstance(line,str) else line for line in tree] #induceTree works on bytes, like the lines read by iterTrees
+		self.forms |= induceTree(tree,self._formCache,self._interned)
 
 	def pprint(self):
 		"""
-		Prints the form of each rule in self.rules in alphabetical order
+		Prints the form of each rule in self.forms in alphabetical order
 		"""
-		prules=[] #We make a list so that we can sort the rules
-		for rule in self.rules:
-			prules.append(rule.form)
-		prules.sort()
-		for rule in prules:
-			print(rule)
+		prules = sorted(self.forms) #We make a sorted list of the forms so that we can print them in one go
+		if prules != []:
+			sys.stdout.write("\n".join(prules)+"\n")
 			
 	def pwrite(self, output):
 		"""
-		Writes the form of each rule in self.rules on outputfile "output" in alphabetical order
+		Writes the form of each rule in self.forms on outputfile "output" in alphabetical order
 		
 		Input: a file to write the rules onto
 		"""
-		prules=[] #We make a list so that we can sort the rules
-		for rule in self.rules:
-			prules.append(rule.form)
-		prules.sort()
+		prules = sorted(self.forms)
 		with open(output, 'w') as fileObject:
-			for rule in prules:
-				fileObject.write(rule+"\n")
-
-class Rule:
-	"""
-	A class for LCFRS-rules.
-	
-	Attributes:
-	 self.lhs: a Predicate object representing the left-hand side of the rule
-	 self.rhs: a list of Predicate objects, or the string "eps" representing the right-hand side of the rule
-	 self.form: a string representation of the rule
-	
-	Functions:
-	 self.__init__(node): From a node object, set the lhs as a predicate with the node lable as its name and the node's arguments as its argument. Set the rhs as a list of predicates based on the node's daughters in a similar fashion. Then contract the lhs and rhs arguments according to the induction algorithm, and finally set self.form as the string representation of the rule by calling self.makeform().
-	 self.mkform(): Sets self.form the string representation of the rule
-	"""
-	def __init__(self,node):
-		"""
-		Sets, from a node object, the lhs as a predicate with the node lable as its name and the node's arguments as its argument, then sets the rhs as a list of predicates based on the node's daughters in a similar fashion, then contracts the lhs and rhs arguments according to the induction algorithm, and finally sets self.form as the string representation of the rule by calling self.makeform()
-		
-		Input: a Node object that either is a leaf node or has all of its daughters listed
-		"""
-		if node.id[0]!="#": #Again, we check if the node is a leaf node
-			self.lhs = Predicate(node.label,[node.id]) #The left hand side of an LCFRS rule consits of a predicate, with the node label as their name. For terminal rules, the argument is the word on the input string
-			self.rhs = "eps" #Terminal rules have an empty string (represented by "eps" for epsilon) as their right-hand side
-		else:
-			args = node.findArgs()
-			self.lhs = Predicate(node.label,args)
-			self.rhs = []
-			for daughter in node.daughters: #The right-hand side of non-terminal rules consists of a list of predicates that are based on the predicates of the daughter nodes.
-				args = daughter.findArgs()
-				self.rhs.append(Predicate(daughter.label,args))
-			count = 0 #We start a new counter to make sure the variables in the arguments of a rule have different names
-			for pred in self.rhs:
-				"""Each right-hand side argument needs only to be represented by a single variable.
-				We then need to make sure that same variable appears on the left-hand side at the same position"""
-				for i in range(len(pred.args)):
-					for j in range(len(self.lhs.args)):
-						if pred.args[i] in self.lhs.args[j]:
-							self.lhs.args[j]+="|" #We add "|" as an end of string marker"
-							self.lhs.args[j]=self.lhs.args[j].replace(pred.args[i]+"Y","X_"+str(count)+"Y")
-							self.lhs.args[j]=self.lhs.args[j].replace(pred.args[i]+"X","X_"+str(count)+"X")
-							self.lhs.args[j]=self.lhs.args[j].replace(pred.args[i]+"|","X_"+str(count)+"|")
-							#We check the next symbol to make sure it's not another numeric symbol
-							self.lhs.args[j]=self.lhs.args[j][:-1] #We remove the end of string marker again
-							pred.args[i] = "X_"+str(count) #We now replace the right hand side argument with the same variable
-							count+=1
-		self.mkform()
-
-	def mkform(self):
-		"""
-		Sets self.form as the string representation of the rule
-		"""
-		form = ""
-		form += self.lhs.mkform()
-		form += "->" #By convention, left-hand side and right-hand side are separated by an arrow symbol
-		if self.rhs == "eps":
-			form += self.rhs #if the right-hand side is already a string, we can append it immediately
-		else:
-			for pred in self.rhs:
-				form += pred.mkform() #By convention, right-hand side predicates are not separated by a symbol
-		self.form = form
-			
-			
-class Predicate:
-	"""
-	A class for LCFRS predicates
-	
-	Attributes:
-	 self.name: a string representing the predicate's name
-	 self.args: a list of strings representing the predicate's arguments
-	 
-	Functions:
-	 self.__init__(name,args): set self.name and self.args
-	 self.mkform(): return the form of the predicate as a string
-	"""
-	def __init__(self,name,args):
-		"""
-		Sets self.name and self.args
-		
-		Input:
-		 name: a string representing the predicate's name
-		 args: a list of strings representing the predicate's arguments
-		"""
-		self.name = name
-		self.args = args
-
-	def mkform(self):
-		"""
-		Returns the form of the predicate as a string
-		
-		Output: the form of the predicate as a string
-		"""
-		form = ""
-		form += self.name
-		form += "(" #By convention, the arguments of a predicate appear in between parentheses
-		for arg in self.args:
-			form += arg
-			if arg == self.args[-1]: #if this is the last argument, the next symbol needs to be the closing bracket
-				form += ")"
-			else:
-				form += "," #By convention, arguments are separated by a comma
-		return form
+			if prules != []:
+				fileObject.write("\n".join(prules)+"\n") #a single write instead of one for every rule
 
 class Node:
 	"""
 	A class for node objects obtained from a treebank in NeGra-format
 	
 	Attributes:
-	 self.id: a string representing the node id, or the word on the input string in case of a leaf node
-	 self.label: a string representing the node label
-	 self.mother: a string matching the node lable of this node's mother node
+	 self.id: bytes representing the node id, or the word on the input string in case of a leaf node
+	 self.label: bytes representing the node label
+	 self.mother: bytes matching the node lable of this node's mother node
 	 self.strID: a list of integers representing the positions of words on the input string dominated by this node
 	 self.daughters: a list of node objects that are daughter nodes of this node
 	 
 	functions:
-	 self.init(l): set self.id, self.label and self.mother based on the inputted node as a list of strings, then initialize self.strID and self.daughters as empty lists.
-	 self.allDaughtersHaveStrID(): return False if there is a daughter whose string ID is empty, otherwise, return True
+	 self.__init__(l,interned): set self.id, self.label and self.mother based on the inputted node as a list of bytes, then initialize self.strID and self.daughters as empty lists.
 	 self.getStrID(): set self.strID based on the string ID's of this node's daughters
-	 self.findArgs(): make a list of arguments from self.strID, and return this list
+	 self.structuralKey(): return a key from which the form of the rule induced from this node follows
 	"""
-	def __init__(self,l):
+	__slots__ = ('id','label','mother','strID','daughters') #nodes are made for every line of the treebank, so we don't give every node its own attribute dictionary
+
+	def __init__(self,l,interned):
 		"""
 		Sets self.id, self.label and self.mother based on the inputted node, then initialize self.strID and self.daughters as empty lists
 		
-		Input: A node in Negra-Format as a list, obtained from splitting its string on tabs
+		Input:
+		 l: A node in Negra-Format as a list of bytes, obtained from splitting its line on tabs
+		 interned: a dictionary holding the one copy of each label and word seen so far. sys.intern only takes strings, so we keep our own dictionary for bytes
 		"""
-		self.id = l[0] #For leaf nodes, this is the word on the input string
-		self.label = l[2]
+		self.label = interned.setdefault(l[2],l[2]) #labels and words come back again and again in the structural keys, so we intern them to keep one copy of each and to speed up comparing them
+		if l[0][:1] == b"#":
+			self.id = l[0]
+		else:
+			self.id = interned.setdefault(l[0],l[0]) #For leaf nodes, this is the word on the input string
 		self.mother = l[5]
 		self.strID = []
 		self.daughters = []
 		
-	def allDaughtersHaveStrID(self):
-		"""
-		Checks if all daughters have a nonempty string ID
-		
-		Output: False if there is a daughter with an empty string ID, True otherwise
-		"""
-		for daughter in self.daughters:
-			if daughter.strID == []:
-				return False
-		return True
-		
 	def getStrID(self):
 		"""
 		Sets self.strID based on the string ID's of this node's daughters
 		"""
 		if len(self.daughters) == 1: #if the node has only one daughter, its string ID is the same as its daughter's
 			self.strID = self.daughters[0].strID
+		elif len(self.daughters) == 2 and (self.daughters[0].strID[-1] < self.daughters[1].strID[0] or self.daughters[1].strID[-1] < self.daughters[0].strID[0]):
+			#The daughters' string ID's are already sorted, so if one daughter's ends before the other's begins, putting them one after the other is enough and we don't need to sort
+			first, second = self.daughters
+			if first.strID[0] > second.strID[0]:
+				first, second = second, first
+			self.strID = first.strID+second.strID
 		else:
 			strID = []
 			for daughter in self.daughters:
 				strID += daughter.strID #if the node has multiple daughters, its string ID is the concatenation of its daughters' string ID's
-			strID.sort()  #We sort the string ID so that we can check if there are any gaps later on
+			strID.sort()  #We sort the string ID so that we can check if there are any gaps later on. The daughters' string ID's are sorted runs, which list.sort merges in linear time
 			self.strID = strID
 				
-	def findArgs(self):
+	def structuralKey(self):
+		"""
+		Computes a key from which the form of the rule induced from this node follows, without building the rule itself.
+		Unlike the string ID's, the key doesn't depend on where the words are on the input string, so the same rule found in different trees has the same key
+		
+		Output: for leaf nodes, a tuple of the node label and the word on the input string. For other nodes, a tuple of the node label, a tuple of the daughters' labels in the order in which the daughters start on the input string, and a tuple with for each left-hand side argument a tuple of the indexes of the daughters whose arguments appear in it, in order
+		"""
+		if self.id[:1]!=b"#":
+			return (self.label,self.id)
+		daughters = sorted(self.daughters,key=lambda daughter: daughter.strID[0])
+		#The daughters are put in the order in which they start on the input string, so that a rule gets the same key no matter in which order its daughters are listed in the treebank
+		labels = []
+		owner = {} #for each position on the input string, the index of the daughter that dominates it
+		for d in range(len(daughters)):
+			labels.append(daughters[d].label)
+			for s in daughters[d].strID:
+				owner[s] = d
+		layout = []
+		prev = None
+		for s in self.strID:
+			d = owner[s]
+			if prev is None or s-1 != prev: #at a gap, a new left-hand side argument starts
+				arg = [d]
+				layout.append(arg)
+			elif d != prevd: #within an argument, a new variable starts wherever the dominating daughter changes
+				arg.append(d)
+			prev = s
+			prevd = d
+		return (self.label,tuple(labels),tuple(tuple(arg) for arg in layout))
+
+ENCODING = locale.getpreferredencoding(False) #the encoding that the treebank would have been read with in text mode, used to decode the forms of the rules
+
+class VarNames(dict):
+	"""
+	A dictionary from integers to variable names as bytes, that makes each variable name the first time it is needed, so that the same name isn't made again for every rule
+	
+	Attributes:
+	 self.prefix: bytes that the variable names start with
+	
+	Functions:
+	 self.__init__(prefix): set self.prefix
+	 self.__missing__(k): make, store and return the variable name for integer "k"
+	"""
+	def __init__(self,prefix):
 		"""
-		Makes a list of arguments from self.strID
+		Sets self.prefix
 		
-		Output: a list of strings, representing the arguments for the LCFRS rule based on this node
+		Input: bytes that the variable names start with
 		"""
-		args = []
-		arg = ""
-		for i in range(len(self.strID)):
-			if i != 0:
-				if self.strID[i]-1 != self.strID[i-1]: 
-				#If the previous integer in the string ID is not one lower than the current one, there is a gap. We introduce an argument boundary at every gap. 
-					args.append(arg)
-					arg = ""
-			arg += "Y_"+str(self.strID[i])
-		args.append(arg)
-		return args
+		dict.__init__(self)
+		self.prefix = prefix
+
+	def __missing__(self,k):
+		"""
+		Makes the variable name for an integer that isn't in the dictionary yet, and stores it
+		
+		Input: an integer
+		Output: the variable name for that integer
+		"""
+		name = self.prefix+b"%d" % k
+		self[k] = name
+		return name
+
+xVars = VarNames(b"X_") #the names of the variables in induced rules
+
+def formFromKey(key):
+	"""
+	Builds the form of the rule induced from a node directly from the node's structural key (see Node.structuralKey), without making any objects for the rule or its predicates
+	
+	Input: a structural key
+	Output: the form of the rule as a string, decoded with ENCODING
+	"""
+	if len(key) == 2: #only the keys of leaf nodes have two elements
+		return (key[0]+b"("+key[1]+b")->eps").decode(ENCODING) #For terminal rules, the argument is the word on the input string, and the right-hand side is an empty string (represented by "eps" for epsilon)
+	label, labels, layout = key
+	count = 0 #We number the variables in the order in which they appear on the left-hand side, so that the same rule always gets the same form
+	lhs = []
+	daughterVars = [[] for d in range(len(labels))] #for each daughter, the variables of its arguments
+	for arg in layout:
+		variables = []
+		for d in arg:
+			variables.append(xVars[count])
+			daughterVars[d].append(xVars[count])
+			count += 1
+		lhs.append(b"".join(variables))
+	rhs = []
+	for d in range(len(labels)):
+		rhs.append(labels[d]+b"("+b",".join(daughterVars[d])+b")")
+	return (label+b"("+b",".join(lhs)+b")->"+b"".join(rhs)).decode(ENCODING) #the labels and words are still bytes, so the form is built as bytes and decoded only once
+	#By convention, arguments are separated by a comma, the left-hand side and right-hand side by an arrow, and right-hand side predicates by nothing
+
+def induceTree(tree,formCache,interned):
+	"""
+	Induces LCFRS rules from a tree "tree", and returns the forms of those rules whose structural key is not in formCache yet.
+	Apart from adding the new keys to formCache once the whole tree is done, this function doesn't change anything, so it can be run on different trees in different processes.
+	
+	Input:
+	 tree: a list of lines (as bytes) representing nodes from a tree in NeGra-format
+	 formCache: a dictionary from the structural keys (see Node.structuralKey) of the nodes that rules have already been induced from to the forms of those rules
+	 interned: a dictionary holding the one copy of each label and word seen so far, see Node.__init__
+	Output: a set of the forms of the rules with a new structural key
+	"""
+	internal = [] #we refer to the non-leaf nodes by their position in this list, so that we can keep their data in plain lists
+	index = {} #for each node ID, the position of the node in internal, so it becomes easy to look nodes up by their id
+	leaves = []
+	for line in tree:
+		node = Node(line.split(b"\t",6),interned) #only the first six fields are used, so secondary edges and comments after them are left unsplit
+		if node.id[:1] == b"#":
+			index[node.id[1:]] = len(internal) #the "#" is sliced off since it also doesn't appear in node.mother
+			internal.append(node)
+		else: #if the nodeID doesn't start with "#", the nodeID is instead the word on the input string, and therefore this node is a leaf node
+			leaves.append(node)
+	for s in range(len(leaves)):
+		leaves[s].strID=[s] 
+		"""Since we're looping over the leaves anyway, we're setting the string ID right here.
+		Since the words are in order of their appearance the string ID matches the position in the list of leaves"""
+		mother = internal[index[leaves[s].mother]]
+		mother.daughters.append(leaves[s]) #As should be obvious, a node is one of its mother's daughter nodes
+	motherIdx = [] #for each node, the position of its mother node in internal, or -1 for a root node
+	pending = [0]*len(internal) #for each node, the number of daughter nodes that don't have their string ID yet. Leaf nodes already have their string ID, so they are not counted
+	for node in internal:
+		if node.mother != b"0": #O is the ID of a root node's mother. Since a root node is not the daugther of any node, the following lines do not apply to them
+			m = index[node.mother]
+			internal[m].daughters.append(node)
+			pending[m] += 1
+			motherIdx.append(m)
+		else:
+			motherIdx.append(-1)
+	nodes2 = [] #the nodes in the order in which they get their string ID
+	ready = deque() #the positions of the nodes whose daughters all have their string ID
+	for i in range(len(internal)):
+		if pending[i] == 0:
+			ready.append(i)
+	while ready: #every node is taken from ready exactly once, so we never have to look at a node that isn't ready yet
+		i = ready.popleft()
+		internal[i].getStrID()
+		nodes2.append(internal[i])
+		m = motherIdx[i]
+		if m != -1:
+			pending[m] -= 1 #one daughter less to wait for
+			if pending[m] == 0: #Do not get the string ID until all daughter nodes have their string ID's
+				ready.append(m)
+	newKeys = {} #the keys that are new in this tree with their forms. They are added to formCache all at once when the tree is done
+	for node in leaves+nodes2:
+		key = node.structuralKey()
+		if key in formCache or key in newKeys: #a node with the same key has already been seen, so its rule has already been returned and we don't need to build it again
+			continue
+		newKeys[key] = formFromKey(key)
+	formCache.update(newKeys)
+	return set(newKeys.values())
+
+_workerCache = None #the formCache of a worker process, see initWorker
+_workerInterned = None #the dictionary of interned labels and words of a worker process, see initWorker
+
+def initWorker():
+	"""
+	Gives a newly started worker process an empty formCache and dictionary of interned labels and words of its own
+	"""
+	global _workerCache, _workerInterned
+	_workerCache = {}
+	_workerInterned = {}
+
+def induceInWorker(tree):
+	"""
+	Calls induceTree for a tree "tree" with the formCache and interned labels and words of the worker process. Every form is returned only once by each worker process, but different worker processes may return the same form
+	
+	Input: a list of lines (as bytes) representing nodes from a tree in NeGra-format
+	Output: a set of the forms of the rules with a structural key that is new to this worker process
+	"""
+	return induceTree(tree,_workerCache,_workerInterned)
+
+def iterTrees(f):
+	"""
+	Reads a treebank file line by line and yields its trees one at a time
+	
+	Input: a treebank file "f" in NeGra-format
+	Output: a generator of trees, each tree being a list of lines (as bytes) representing nodes in NeGra-format
+	"""
+	tree = None
+	with open(f, 'rb') as fileObject: #the file is read as bytes, so that lines don't have to be decoded until a new rule is found
+		for line in fileObject:
+			line = line.rstrip(b"\r\n")
+			if line[:1] != b"#": #most lines are leaf nodes, which don't start with "#", so we check for those first
+				if tree is not None: #lines outside of a sequence are not part of any tree
+					tree.append(line) #Putting nodes (lines) in the treelist
+			elif line.startswith(b"#BOS"):
+				tree = [] #Initializing a new treelist at beginning of sequence (#BOS)
+			elif line.startswith(b"#EOS"):
+				if tree is not None: #an #EOS without an open sequence doesn't end any tree
+					yield tree #Handing over the tree at end of sequence (#EOS)
+				tree = None
+			elif tree is not None:
+				tree.append(line) #non-leaf nodes also start with "#"
 
 def helptext():
-	t="\n A program for inducing an LCFRS-grammar from a treebank in NEGRA format.\n\n Usage: python3 inducer.py [-h] [-o outputfile] inputfile\n\n Input:\n  -h: display this help message and exit\n  -o outputfile: file to write the induced grammar on\n  inputfile: treebank in NeGra format to induce from\n\n Output: the grammar rules of the induced grammar on the outputfile if specified, and otherwise printed in the terminal"
+	t="\n A program for inducing an LCFRS-grammar from a treebank in NEGRA format.\n\n Usage: python3 inducer.py [-h] [-o outputfile] [-j processes] [-v] inputfile\n\n Input:\n  -h: display this help message and exit\n  -o outputfile: file to write the induced grammar on\n  -j processes: number of worker processes to induce with (default: one per CPU)\n  -v: report the progress every 1000 trees\n  inputfile: treebank in NeGra format to induce from\n\n Output: the grammar rules of the induced grammar on the outputfile if specified, and otherwise printed in the terminal"
 	return(t)
 
 def main(args):
-	opts, args = getopt.getopt(args,'ho:')
+	opts, args = getopt.getopt(args,'ho:j:v')
 	f_out = None
+	processes = os.cpu_count() or 1 #on the command line we use all CPU's by default
+	verbose = False
 	for o, a in opts:
 		if o == "-h":
 			return(helptext())
 		if o == "-o":
 			f_out = a
-	grammar = Grammar(args[0])
+		if o == "-j":
+			if not a.isdigit() or int(a) < 1:
+				return("\n error: -j needs a positive whole number of processes, not \""+a+"\"\n"+helptext())
+			processes = int(a)
+		if o == "-v":
+			verbose = True
+	grammar = Grammar(args[0],processes,verbose)
 	print("grammar made")
 	if f_out == None:
 		grammar.pprint()
@@ -315,5 +360,4 @@ def main(args):
 	
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main(sys.argv[1:]))